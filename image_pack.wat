@@ -0,0 +1,51 @@
+;; Threshold and bit-pack kernel for the web upload page in with_wifi_example.py.
+;;
+;; The page embeds the assembled module as base64 (PACK_WASM); rebuild it with
+;;   wat2wasm image_pack.wat -o - | base64 -w0
+;; after editing this file.
+;;
+;; Memory layout: width*height RGBA pixels at offset 0, packed output at $out.
+;; Each pixel is converted to ITU-R BT.601 luma in fixed point (77/150/29 out
+;; of 256), thresholded at 128 and written back as opaque black or white for
+;; the preview. Set bits (white) are packed MSB first, rows padded to a byte.
+(module
+  (memory (export "memory") 2)
+  (func (export "pack") (param $w i32) (param $h i32) (param $out i32)
+    (local $px i32) (local $x i32) (local $p i32) (local $white i32) (local $byte i32)
+    (loop $rows
+      (local.set $x (i32.const 0))
+      (local.set $byte (i32.const 0))
+      (loop $cols
+        (local.set $p (i32.load (local.get $px)))
+        ;; white = luma > 128
+        (local.set $white
+          (i32.gt_u
+            (i32.shr_u
+              (i32.add
+                (i32.add
+                  (i32.mul (i32.and (local.get $p) (i32.const 0xff)) (i32.const 77))
+                  (i32.mul (i32.and (i32.shr_u (local.get $p) (i32.const 8)) (i32.const 0xff)) (i32.const 150)))
+                (i32.mul (i32.and (i32.shr_u (local.get $p) (i32.const 16)) (i32.const 0xff)) (i32.const 29)))
+              (i32.const 8))
+            (i32.const 128)))
+        ;; preview pixel: 0xffffffff for white, 0xff000000 for black
+        (i32.store (local.get $px)
+          (i32.or (i32.sub (i32.const 0) (local.get $white)) (i32.const 0xff000000)))
+        (local.set $byte (i32.or (i32.shl (local.get $byte) (i32.const 1)) (local.get $white)))
+        (local.set $px (i32.add (local.get $px) (i32.const 4)))
+        (local.set $x (i32.add (local.get $x) (i32.const 1)))
+        ;; flush every 8 pixels
+        (if (i32.eqz (i32.and (local.get $x) (i32.const 7)))
+          (then
+            (i32.store8 (local.get $out) (local.get $byte))
+            (local.set $out (i32.add (local.get $out) (i32.const 1)))
+            (local.set $byte (i32.const 0))))
+        (br_if $cols (i32.lt_u (local.get $x) (local.get $w))))
+      ;; flush the partial last byte of the row, left-aligned
+      (if (i32.and (local.get $x) (i32.const 7))
+        (then
+          (i32.store8 (local.get $out)
+            (i32.shl (local.get $byte) (i32.sub (i32.const 8) (i32.and (local.get $x) (i32.const 7)))))
+          (local.set $out (i32.add (local.get $out) (i32.const 1)))))
+      (local.set $h (i32.sub (local.get $h) (i32.const 1)))
+      (br_if $rows (local.get $h)))))
@@ -13,8 +13,19 @@ This code is released under the MIT License.
 See the license terms in LICENSE file at https://opensource.org/licenses/MIT
 """
 
+import framebuf
 import machine
+import micropython
 import time
+from micropython import const
+
+try:
+    import os
+    import rp2
+    # The SPI register addresses below are specific to the RP2040
+    _HAS_SPI_DMA = hasattr(rp2, "DMA") and "RP2040" in os.uname().machine
+except ImportError:
+    _HAS_SPI_DMA = False
 
 # 2.13 inch e-Paper display resolution
 DISPLAY_WIDTH  = 122
@@ -30,6 +41,31 @@ DEFAULT_BUSY_PIN = 5   # Busy pin - indicates when the display is processing com
 DEFAULT_SCK_PIN  = 2   # SPI Clock pin - provides the clock signal for SPI communication - SCL
 DEFAULT_MOSI_PIN = 3   # SPI MOSI (Master Out Slave In) pin - sends data from Pico to display - SDA
 
+# Set to 1 to log BUSY waits and power events. Being an underscore-prefixed
+# const(), MicroPython strips the guarded print() calls at compile time when 0.
+_DEBUG = const(0)
+
+# BUSY only rises a short while after a command such as 0x20 (GxEPD2 waits 1ms
+# before polling it); the waits give it this long before treating LOW as idle
+_BUSY_RISE_US = const(1000)
+
+# RP2040 SPI peripheral registers and TX DMA request lines, indexed by SPI bus ID
+# Reference: Section 4.4 https://datasheets.raspberrypi.com/rp2040/rp2040-datasheet.pdf
+_SPI_BASE       = (0x4003C000, 0x40040000)
+_SPI_TX_DREQ    = (16, 18)
+_SPI_SSPDR      = 0x008  # Data register (TX FIFO)
+_SPI_SSPSR      = 0x00C  # Status register
+_SPI_SSPSR_BSY  = 0x10   # Busy flag - set while a frame is being shifted out
+
+# Payloads above this size are sent by DMA in the async display path
+_DMA_THRESHOLD = 64
+
+def _as_buffer(data):
+    """Return data unchanged if SPI can write it directly, else as bytes."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return data
+    return bytes(data)
+
 class EPaperDisplay:
     """
     Driver for 2.13 inch e-Paper display.
@@ -41,9 +77,19 @@ class EPaperDisplay:
     Attributes:
         width (int): Display width in pixels (122)
         height (int): Display height in pixels (250)
+        fb (framebuf.FrameBuffer): Drawing surface shown by display() when no
+            image is given. Color 1 is white and 0 is black.
     """
     
-    def __init__(self, rst_pin=None, dc_pin=None, cs_pin=None, busy_pin=None, sck_pin=None, mosi_pin=None, spi_id=0, baudrate=4000000):
+    # Configuration sent by init() after the resets, as (command, parameters)
+    # pairs; each pair is written in a single command+data transaction
+    _INIT_SEQ = (
+        (0x01, b'\xf9\x00\x00'),    # Driver output control: 250 gates, normal scan
+        (0x11, b'\x03'),            # RAM data entry mode: X and Y increment
+        (0x3C, b'\xc0'),            # Border waveform: black/white/black
+    )
+    
+    def __init__(self, rst_pin=None, dc_pin=None, cs_pin=None, busy_pin=None, sck_pin=None, mosi_pin=None, spi_id=0, baudrate=10000000):
         """
         Initialize the e-Paper display.
         
@@ -55,7 +101,9 @@ class EPaperDisplay:
             sck_pin (int, optional): SPI clock pin number. Defaults to DEFAULT_SCK_PIN.
             mosi_pin (int, optional): SPI MOSI pin number. Defaults to DEFAULT_MOSI_PIN.
             spi_id (int, optional): SPI bus ID. Defaults to 0.
-            baudrate (int, optional): SPI baudrate. Defaults to 4000000.
+            baudrate (int, optional): SPI baudrate. Defaults to 10000000.
+                The controller accepts write clocks up to 20MHz; lower this
+                if long wiring causes transfer artifacts.
         """
         # Use provided pins or defaults
         self.RST_PIN = rst_pin if rst_pin is not None else DEFAULT_RST_PIN
@@ -69,7 +117,7 @@ class EPaperDisplay:
         # Initialize SPI communication
         # Read more: https://docs.micropython.org/en/latest/library/machine.SPI.html
         # - SPI is a synchronous serial communication protocol used for display communication
-        # - baudrate: Communication speed (4MHz default)
+        # - baudrate: Communication speed (10MHz default)
         # - polarity=0, phase=0: SPI mode 0 (most common for displays)
         # - sck: Clock signal that synchronizes data transmission
         # - mosi: Master Out Slave In - data sent from microcontroller to display
@@ -91,18 +139,68 @@ class EPaperDisplay:
         self.cs = machine.Pin(self.CS_PIN, machine.Pin.OUT)
         self.busy = machine.Pin(self.BUSY_PIN, machine.Pin.IN)
         
+        # Cache bound methods used on every transfer; each self.cs.value(...)
+        # otherwise costs two attribute lookups plus a method bind
+        self._cs = self.cs.value
+        self._dc = self.dc.value
+        self._rst = self.rst.value
+        self._busy_val = self.busy.value
+        self._spi_write = self.spi.write
+        
+        self.spi_id = spi_id
+        self._dma = None  # Claimed on first use by the async display path
+        
+        # BUSY falls when the controller finishes an operation; the IRQ flags it
+        # so wait_until_idle can wake immediately instead of on the next poll
+        self._busy_evt = False
+        self._busy_flag = None  # ThreadSafeFlag, created by the first async wait
+        # Not every port supports edge IRQs on every pin (e.g. ESP8266 GPIO16);
+        # without one the waits fall back to polling with a short back-off
+        try:
+            self.busy.irq(trigger=machine.Pin.IRQ_FALLING, handler=self._busy_irq)
+            self._busy_irq_ok = True
+        except (AttributeError, ValueError):
+            self._busy_irq_ok = False
+        
         self.width = DISPLAY_WIDTH
         self.height = DISPLAY_HEIGHT
+        # Line width in bytes (each byte represents 8 horizontal pixels)
+        self._linewidth = (self.width + 7) >> 3
+        # Size of a full-frame image buffer in bytes
+        self._frame_bytes = self._linewidth * self.height
+        # SET_RAM_X/Y_ADDRESS_START_END_POSITION parameters for the full screen
+        self._full_win_x = bytes((0x00, ((self.width - 1) >> 3) & 0xFF))
+        self._full_win_y = bytes((0x00, 0x00,
+                                  (self.height - 1) & 0xFF,
+                                  ((self.height - 1) >> 8) & 0xFF))
+        
+        # Frame buffer owned by the driver, so callers can draw with the C-backed
+        # framebuf primitives instead of packing pixels in Python
+        self._fb_bytes = bytearray(b'\xff') * self._frame_bytes  # Start white
+        self.fb = framebuf.FrameBuffer(self._fb_bytes, self.width, self.height,
+                                       framebuf.MONO_HLSB)
+        self._fb_mv = memoryview(self._fb_bytes)
+        # Copy of the frame buffer as last shown, used to refresh only the rows
+        # that changed; invalid until the frame buffer has been fully displayed
+        self._shadow = bytearray(self._frame_bytes)
+        self._shadow_valid = False
+
+        # Preallocated transmit buffers, reused on every write so the command,
+        # single-byte data and parameter paths do not allocate on the heap
+        self._b1 = bytearray(1)
+        self._data_buf = bytearray(8)
+        self._data_mv = memoryview(self._data_buf)
     
     def power_off(self):
         """Power down the module.
         
         Sets all control pins to 0 to put the module in low power consumption mode.
         """
-        self.rst.value(0)
-        self.dc.value(0)
-        self.cs.value(0)
-        print("close 5V, Module enters 0 power consumption ...")
+        self._rst(0)
+        self._dc(0)
+        self._cs(0)
+        if _DEBUG:
+            print("close 5V, Module enters 0 power consumption ...")
 
     def hw_reset(self):
         """Hardware reset of the display.
@@ -112,21 +210,25 @@ class EPaperDisplay:
         controller to its initial state and prepares it for initialization commands.
         
         The sequence consists of:
-        1. Setting RST high (1) for 200μs
+        1. Setting RST high (1) for 10μs
         2. Setting RST low (0) for 200μs (active reset)
         3. Setting RST high (1) again for 200μs
         4. Waiting for the busy signal to clear
         
+        Only the low pulse and the settling time after release are timing
+        critical; the leading high phase just guarantees a clean falling edge,
+        so it is kept short.
+        
         Note: Hardware reset is typically performed once at startup before
         sending any initialization commands to the display.
 
         Reference: Page 28 Section 13.2 https://github.com/WeActStudio/WeActStudio.EpaperModule/blob/master/Doc/ZJY122250-0213BBDMFGN-R.pdf
         """
-        self.rst.value(1)        # Set reset pin high
-        time.sleep_us(200)       # Wait 200 microseconds
-        self.rst.value(0)        # Set reset pin low (active reset state)
+        self._rst(1)             # Set reset pin high
+        time.sleep_us(10)        # Wait 10 microseconds for a clean falling edge
+        self._rst(0)             # Set reset pin low (active reset state)
         time.sleep_us(200)       # Hold in reset state for 200 microseconds
-        self.rst.value(1)        # Release from reset state
+        self._rst(1)             # Release from reset state
         time.sleep_us(200)       # Wait 200 microseconds for internal initialization
         self.wait_until_idle()          # Wait until the display is no longer busy
 
@@ -158,10 +260,10 @@ class EPaperDisplay:
         
         Reference: Page 28 Section 13.2 https://github.com/WeActStudio/WeActStudio.EpaperModule/blob/master/Doc/ZJY122250-0213BBDMFGN-R.pdf
         """
-        self.send_command(0x01)  # Driver output control      
-        self.send_data(0xf9)     # Set gate number (249)
-        self.send_data(0x00)     # Set gate scanning direction
-        self.send_data(0x00)     # Set left/right alternate pixel arrangement
+        self.send_command_data(0x01, (  # Driver output control
+            0xf9,                       # Set gate number (249)
+            0x00,                       # Set gate scanning direction
+            0x00))                      # Set left/right alternate pixel arrangement
 
     def set_ram_data_entry_mode(self, mode=0x03):
         """Set RAM data entry mode.
@@ -177,48 +279,162 @@ class EPaperDisplay:
         self.send_command(0x11)  # RAM data entry mode setting
         self.send_data(mode)
 
-    def send_command(self, command):
+    @micropython.viper
+    def send_command(self, command: int):
         """Send command to the display.
         
+        Compiled with the viper emitter: the command byte is stored through a
+        raw pointer into the preallocated buffer without boxing the int.
+        
         Args:
             command: Command byte to send to the register
         """
-        self.dc.value(0)
-        self.cs.value(0)
-        self.spi.write(bytes([command]))
-        self.cs.value(1)
+        buf = ptr8(self._b1)
+        buf[0] = command
+        self._dc(0)
+        self._cs(0)
+        self._spi_write(self._b1)
+        self._cs(1)
 
+    @micropython.native
     def send_data(self, data):
         """Send a single byte of data to the display.
         
         Args:
             data: Data byte to send
         """
-        self.dc.value(1)
-        self.cs.value(0)
-        self.spi.write(bytes([data]))
-        self.cs.value(1)
+        self._b1[0] = data
+        self._dc(1)
+        self._cs(0)
+        self._spi_write(self._b1)
+        self._cs(1)
+
+    @micropython.native
+    def send_command_data(self, command, data):
+        """Send a command followed by its parameter bytes in one transaction.
+        
+        The command byte and its parameters share a single CS-low window: DC is
+        held low for the command, then raised for the parameters, which are
+        emitted with one SPI write instead of one write per byte.
+        
+        Args:
+            command: Command byte to send to the register
+            data: Sequence of up to 8 parameter bytes
+        """
+        n = len(data)
+        for i in range(n):
+            self._data_buf[i] = data[i]
+        self._write_cmd_then_data(command, self._data_mv[:n])
+
+    @micropython.native
+    def _write_cmd_then_data(self, command, data):
+        """Write a command byte and a data buffer inside one CS-low window.
+        
+        Args:
+            command: Command byte to send to the register
+            data: Bytes, bytearray or memoryview written without copying
+        """
+        self._b1[0] = command
+        self._dc(0)
+        self._cs(0)
+        self._spi_write(self._b1)
+        self._dc(1)
+        self._spi_write(data)
+        self._cs(1)
 
+    @micropython.native
     def send_bytes(self, data):
         """Send multiple bytes of data to the display.
         
+        Buffer objects (bytes, bytearray, memoryview) are written as-is; any
+        other sequence of ints is copied to bytes first.
+        
         Args:
             data: Bytes object or bytearray containing data to send
         """
-        self.dc.value(1)
-        self.cs.value(0)
-        self.spi.write(bytes(data))
-        self.cs.value(1)
+        data = _as_buffer(data)
+        self._dc(1)
+        self._cs(0)
+        self._spi_write(data)
+        self._cs(1)
     
+    def _busy_irq(self, pin):
+        """BUSY pin falling-edge handler: flags the display as idle."""
+        self._busy_evt = True
+        if self._busy_flag is not None:
+            self._busy_flag.set()
+
+    @micropython.native
+    def _busy_started(self):
+        """Wait up to _BUSY_RISE_US for BUSY to go HIGH; False if it stays LOW."""
+        start = time.ticks_us()
+        while self._busy_val() == 0:
+            if time.ticks_diff(time.ticks_us(), start) >= _BUSY_RISE_US:
+                return False
+        return True
+
+    @micropython.native
     def wait_until_idle(self):
         """Wait until the busy_pin goes LOW.
         
-        Polls the busy pin until the display is ready to accept new commands.
+        Returns once BUSY has stayed LOW for _BUSY_RISE_US, so a refresh that
+        has been triggered but not yet raised BUSY is not mistaken for idle.
+        Otherwise the CPU sleeps in machine.idle() until the BUSY falling-edge
+        IRQ fires; the pin is re-checked on every wake-up so a missed edge
+        cannot hang the wait.
+        Without the IRQ the pin is polled, starting at 1ms and backing off to
+        10ms, so short partial-refresh waits are not rounded up to 10ms.
         """
-        print("e-Paper: waiting for display to be ready...")
-        while self.busy.value() == 1:      # 0: idle, 1: busy
-            time.sleep_ms(10)  
-        print("e-Paper: display ready")
+        self._busy_evt = False
+        if not self._busy_started():      # 0: idle, 1: busy
+            return
+        if _DEBUG:
+            print("e-Paper: waiting for display to be ready...")
+        if self._busy_irq_ok:
+            while not self._busy_evt and self._busy_val() == 1:
+                machine.idle()
+        else:
+            delay = 1
+            while self._busy_val() == 1:
+                time.sleep_ms(delay)
+                if delay < 10:
+                    delay += 1
+        if _DEBUG:
+            print("e-Paper: display ready")
+
+    async def wait_until_idle_async(self):
+        """Wait until the busy_pin goes LOW without blocking other tasks.
+        
+        Like wait_until_idle(), first gives BUSY _BUSY_RISE_US to go HIGH,
+        polling the pin between yields to the scheduler.
+        Awaits the flag set by the BUSY falling-edge IRQ, so other asyncio
+        tasks run for the whole duration of the refresh. Without the IRQ the
+        pin is polled with the same 1ms to 10ms back-off as wait_until_idle().
+        """
+        # Imported and allocated here so sync-only users pay for neither
+        import asyncio
+        if self._busy_flag is None:
+            self._busy_flag = asyncio.ThreadSafeFlag()
+        self._busy_flag.clear()
+        # Give BUSY _BUSY_RISE_US to go HIGH, yielding to other tasks instead
+        # of spinning like _busy_started()
+        start = time.ticks_us()
+        while self._busy_val() == 0:       # 0: idle, 1: busy
+            if time.ticks_diff(time.ticks_us(), start) >= _BUSY_RISE_US:
+                return
+            await asyncio.sleep_ms(0)
+        if _DEBUG:
+            print("e-Paper: waiting for display to be ready...")
+        if self._busy_irq_ok:
+            await self._busy_flag.wait()
+        else:
+            delay = 1
+            while self._busy_val() == 1:
+                await asyncio.sleep_ms(delay)
+                if delay < 10:
+                    delay += 1
+        if _DEBUG:
+            print("e-Paper: display ready")
 
     def display_update(self):
         """Turn on display with standard refresh.
@@ -255,6 +471,29 @@ class EPaperDisplay:
         self.send_command(0x20) # Activate Display Update Sequence
         self.wait_until_idle()
 
+    def turn_on_display_fast(self):
+        """Turn on display with fast refresh.
+        
+        Uses the Display Update Control parameter 0xC7 (binary 11000111), which
+        runs the same sequence as 0xF7 but skips loading the temperature value,
+        so the refresh starts sooner at the cost of temperature compensation.
+        """
+        self.send_command_data(0x22, (0xC7,))  # Fast refresh mode parameter
+        self.send_command(0x20) # Activate Display Update Sequence
+        self.wait_until_idle()
+
+    def turn_on_display_partial(self):
+        """Turn on display with partial refresh.
+        
+        Uses the Display Update Control parameter 0xFF (binary 11111111), which
+        selects DISPLAY Mode 2: only pixels that differ between the new image
+        (RAM 0x24) and the previous image (RAM 0x26) are driven, using the
+        controller's built-in partial waveform.
+        """
+        self.send_command_data(0x22, (0xFF,))  # Partial refresh mode parameter
+        self.send_command(0x20) # Activate Display Update Sequence
+        self.wait_until_idle()
+
     def set_window(self, x_start, y_start, x_end, y_end):
         """Set the display update window.
         
@@ -267,16 +506,25 @@ class EPaperDisplay:
         Note:
             X positions must be multiples of 8 or the last 3 bits will be ignored.
         """
-        self.send_command(0x44) # SET_RAM_X_ADDRESS_START_END_POSITION
         # x point must be the multiple of 8 or the last 3 bits will be ignored
-        self.send_data((x_start>>3) & 0xFF)
-        self.send_data((x_end>>3) & 0xFF)
+        self.send_command_data(0x44, (  # SET_RAM_X_ADDRESS_START_END_POSITION
+            (x_start >> 3) & 0xFF,
+            (x_end >> 3) & 0xFF))
+        
+        self.send_command_data(0x45, (  # SET_RAM_Y_ADDRESS_START_END_POSITION
+            y_start & 0xFF,
+            (y_start >> 8) & 0xFF,
+            y_end & 0xFF,
+            (y_end >> 8) & 0xFF))
+
+    def _set_full_window(self):
+        """Set the display update window to the full screen.
         
-        self.send_command(0x45) # SET_RAM_Y_ADDRESS_START_END_POSITION
-        self.send_data(y_start & 0xFF)
-        self.send_data((y_start >> 8) & 0xFF)
-        self.send_data(y_end & 0xFF)
-        self.send_data((y_end >> 8) & 0xFF)
+        Fast path for set_window(0, 0, width-1, height-1) using the parameter
+        bytes precomputed in __init__.
+        """
+        self._write_cmd_then_data(0x44, self._full_win_x)
+        self._write_cmd_then_data(0x45, self._full_win_y)
 
     def set_cursor(self, x, y):
         """Set the cursor position for the next data write.
@@ -288,13 +536,12 @@ class EPaperDisplay:
         Note:
             X position must be a multiple of 8 or the last 3 bits will be ignored.
         """
-        self.send_command(0x4E) # SET_RAM_X_ADDRESS_COUNTER
         # x point must be the multiple of 8 or the last 3 bits will be ignored
-        self.send_data(x & 0xFF)
+        self.send_command_data(0x4E, ((x >> 3) & 0xFF,))  # SET_RAM_X_ADDRESS_COUNTER
         
-        self.send_command(0x4F) # SET_RAM_Y_ADDRESS_COUNTER
-        self.send_data(y & 0xFF)
-        self.send_data((y >> 8) & 0xFF)
+        self.send_command_data(0x4F, (  # SET_RAM_Y_ADDRESS_COUNTER
+            y & 0xFF,
+            (y >> 8) & 0xFF))
 
     def init(self):
         """Initialize the e-Paper display.
@@ -304,6 +551,10 @@ class EPaperDisplay:
         the "Normal Operation Flow" described in section 13.1 (Typical Operating Sequence)
         on page 27 of the display controller datasheet.
         
+        Both resets wait for BUSY to clear. The configuration commands sent
+        afterwards (0x01, 0x11, 0x3C, 0x44, 0x45) only set registers and do not
+        raise BUSY, so no further wait is needed before the first display call.
+        
         Reference: https://github.com/WeActStudio/WeActStudio.EpaperModule/blob/master/Doc/ZJY122250-0213BBDMFGN-R.pdf
         
         Returns:
@@ -315,29 +566,212 @@ class EPaperDisplay:
         # SW Reset
         self.sw_reset()
 
-        self.set_display_size_and_driver_output()
-
-        self.set_ram_data_entry_mode()
-
-        self.set_window(0, 0, self.width-1, self.height-1)
-        self.set_border()
-        
-        self.wait_until_idle()
+        # Driver output, data entry mode and border
+        for command, data in self._INIT_SEQ:
+            self._write_cmd_then_data(command, data)
+        self._set_full_window()
+        # The reset may follow a power cycle that wiped controller RAM, so the
+        # next frame buffer display() must re-send the base image in full
+        self._shadow_valid = False
     
-    def display(self, image):
+    def display(self, image=None, full=False):
         """Send image buffer to e-Paper and display it.
         
         This method sends the provided image data to the display's RAM and
         triggers a display refresh to show the image on screen.
         
+        When no image is given the fb frame buffer is shown. The first time it
+        is shown with a full refresh; after that only the band of rows that
+        changed since the last call is sent and refreshed with partial
+        refresh, and nothing is sent if the frame buffer is unchanged.
+        
         Args:
-            image: Byte array containing the image data to display.
+            image (optional): Byte array containing the image data to display.
                    Each byte represents 8 horizontal pixels (1 bit per pixel).
+                   A memoryview is sent as-is, without copying.
+                   Defaults to the contents of the fb frame buffer.
+            full (bool, optional): Force a full refresh of the frame buffer,
+                   e.g. to clear ghosting left by repeated partial refreshes.
         """
-        self.set_cursor(0, 0)        # Set cursor to top-left corner
-        self.send_command(0x24)      # WRITE_RAM command - write to display RAM
-        self.send_bytes(image)       # Send the entire image buffer
+        if image is None:
+            self._display_framebuffer(full)
+            return
+        image = _as_buffer(image)
+        self._write_frame(image)     # Write the entire image buffer to display RAM
         self.turn_on_display()       # Refresh the display to show the new image
+
+    def _display_framebuffer(self, full):
+        """Show the fb frame buffer, refreshing only the rows that changed."""
+        fb = self._fb_bytes
+        if full or not self._shadow_valid:
+            self.display_base(fb)
+            self._shadow[:] = fb
+            self._shadow_valid = True
+            return
+        rows = self._dirty_rows()
+        if rows is None:
+            return
+        first, last = rows
+        start = first * self._linewidth
+        end = (last + 1) * self._linewidth
+        band = self._fb_mv[start:end]  # HLSB rows are contiguous: no copy
+        self.display_partial(band, 0, first, self.width, last - first + 1)
+        self._shadow[start:end] = band
+        self._shadow_valid = True
+
+    @micropython.native
+    def _dirty_rows(self):
+        """Find the rows of the frame buffer that differ from the shadow copy.
+        
+        Returns:
+            tuple: (first_row, last_row) of the changed band, or None if the
+                   frame buffer is unchanged.
+        """
+        fb = self._fb_bytes
+        shadow = self._shadow
+        if fb == shadow:
+            return None
+        i = 0
+        while fb[i] == shadow[i]:
+            i += 1
+        j = self._frame_bytes - 1
+        while fb[j] == shadow[j]:
+            j -= 1
+        return i // self._linewidth, j // self._linewidth
+
+    def display_fast(self, image=None):
+        """Send image buffer to e-Paper and display it with fast refresh.
+        
+        Args:
+            image (optional): Byte array containing the full-frame image data
+                   to display. Defaults to the contents of the fb frame buffer.
+        """
+        if image is None:
+            image = self._fb_bytes
+        self._write_frame(_as_buffer(image))
+        self.turn_on_display_fast()
+
+    def display_base(self, image=None):
+        """Display a base image for subsequent partial refreshes.
+        
+        Writes the image to both the new-image RAM (0x24) and the previous-image
+        RAM (0x26) before a full refresh, so the first display_partial() call
+        compares against what is actually on screen.
+        
+        Args:
+            image (optional): Byte array containing the full-frame image data
+                   to display. Defaults to the contents of the fb frame buffer.
+        """
+        if image is None:
+            image = self._fb_bytes
+        image = _as_buffer(image)
+        self._write_frame(image)
+        self._write_frame(image, 0x26)
+        self.turn_on_display()
+
+    def display_partial(self, image, x, y, w, h):
+        """Update a rectangular region of the screen with partial refresh.
+        
+        Only the bytes covering the region are sent over SPI, and the refresh
+        uses the quicker partial waveform instead of the full-screen flash.
+        Call display_base() once beforehand so the controller knows what is
+        currently shown.
+        
+        Args:
+            image: Byte array with the region's pixels, row by row,
+                   ((w + 7) // 8) bytes per row and h rows. A memoryview
+                   slice of a larger buffer is sent as-is, without copying;
+                   for full-width regions this is simply
+                   memoryview(frame)[y * linewidth:(y + h) * linewidth].
+            x: X-axis position of the region (multiple of 8)
+            y: Y-axis position of the region
+            w: Width of the region in pixels
+            h: Height of the region in pixels
+        
+        Raises:
+            ValueError: If image does not match the size of the region.
+        """
+        size = ((w + 7) >> 3) * h
+        if len(image) != size:
+            raise ValueError("partial image must be %d bytes" % size)
+        image = _as_buffer(image)
+        self._shadow_valid = False
+        self.set_window(x, y, x + w - 1, y + h - 1)
+        self.set_cursor(x, y)
+        self._write_cmd_then_data(0x24, image)  # WRITE_RAM for the region only
+        self.turn_on_display_partial()
+
+    async def display_async(self, image=None):
+        """Send image buffer to e-Paper and display it without blocking.
+        
+        Same as display(), but on the RP2040 the image buffer is streamed to the
+        SPI TX FIFO by DMA while other asyncio tasks run, and the refresh is
+        awaited through the BUSY IRQ instead of blocking the CPU.
+        
+        Args:
+            image (optional): Byte array containing the full-frame image data
+                   to display. Defaults to the contents of the fb frame buffer.
+        """
+        if image is None:
+            image = self._fb_bytes
+        image = _as_buffer(image)
+        self._shadow_valid = False
+        self._set_full_window()
+        self.set_cursor(0, 0)
+        await self._write_cmd_then_data_async(0x24, image)
+        self.display_update()
+        self.send_command(0x20) # Activate Display Update Sequence
+        await self.wait_until_idle_async()
+
+    async def _write_cmd_then_data_async(self, command, data):
+        """Write a command byte and a data buffer, sending the data by DMA.
+        
+        Falls back to the blocking _write_cmd_then_data() for small payloads
+        or when SPI DMA is not available on this port.
+        
+        Args:
+            command: Command byte to send to the register
+            data: Bytes, bytearray or memoryview written without copying
+        """
+        if not _HAS_SPI_DMA or len(data) <= _DMA_THRESHOLD:
+            self._write_cmd_then_data(command, data)
+            return
+        if self._dma is None:
+            self._dma = rp2.DMA()
+            self._dma_ctrl = self._dma.pack_ctrl(size=0, inc_write=False,
+                                                 treq_sel=_SPI_TX_DREQ[self.spi_id])
+        base = _SPI_BASE[self.spi_id]
+        self._b1[0] = command
+        self._dc(0)
+        self._cs(0)
+        self._spi_write(self._b1)
+        self._dc(1)
+        self._dma.config(read=data, write=base + _SPI_SSPDR, count=len(data),
+                         ctrl=self._dma_ctrl, trigger=True)
+        import asyncio
+        while self._dma.active():
+            await asyncio.sleep_ms(0)
+        # The DMA is done once the FIFO is fed; wait for the last byte to shift out
+        while machine.mem32[base + _SPI_SSPSR] & _SPI_SSPSR_BSY:
+            pass
+        self._cs(1)
+
+    def _write_frame(self, image, command=0x24):
+        """Write a full-frame buffer to display RAM.
+        
+        Restores the full-screen window first, since display_partial() leaves
+        the window confined to its region.
+        
+        Args:
+            image: Buffer (bytes, bytearray or memoryview) containing the
+                full-frame image data, as returned by _as_buffer().
+            command (int, optional): RAM to write, 0x24 (new image, default)
+                or 0x26 (previous image).
+        """
+        self._shadow_valid = False
+        self._set_full_window()
+        self.set_cursor(0, 0)        # Set cursor to top-left corner
+        self._write_cmd_then_data(command, image)
     
     def clear(self, color=0xFF):
         """Clear the display screen.
@@ -349,14 +783,8 @@ class EPaperDisplay:
                 - 0xFF: White (default)
                 - 0x00: Black
         """
-        # Calculate line width in bytes (each byte represents 8 horizontal pixels)
-        if self.width % 8 == 0:
-            linewidth = int(self.width / 8)
-        else:
-            linewidth = int(self.width / 8) + 1
-        
         # Create a buffer filled with the specified color
-        buffer = [color] * int(self.height * linewidth)
+        buffer = bytearray((color,)) * self._frame_bytes
         
         # Send the buffer to the display and refresh
         self.display(buffer)
@@ -1,48 +1,22 @@
 #!/usr/bin/env python
 
-from micropython_epaper_display import EPaperDisplay
+from micropython_epaper_display import EPaperDisplay, DISPLAY_WIDTH, DISPLAY_HEIGHT
+import micropython
 import network
+import select
 import socket
 import time
 import json
 
-def connect_wifi(ssid, password):
-    # Create WLAN interface
-    wlan = network.WLAN(network.STA_IF)
-    wlan.active(True)
-    
-    # Connect to WiFi if not already connected
-    if not wlan.isconnected():
-        print(f'Connecting to WiFi network: {ssid}...')
-        wlan.connect(ssid, password)
-        
-        # Wait for connection with timeout
-        max_wait = 10
-        while max_wait > 0:
-            if wlan.isconnected():
-                break
-            max_wait -= 1
-            print('Waiting for connection...')
-            time.sleep(1)
-    
-    if wlan.isconnected():
-        print('WiFi connected successfully')
-        print('Network config:', wlan.ifconfig())
-        return True
-    else:
-        print('WiFi connection failed')
-        return False
+# deflate (MicroPython 1.21+) gzips the page and inflates compressed uploads
+try:
+    import deflate
+    import io
+except ImportError:
+    deflate = None
 
-def start_webserver():
-    addr = socket.getaddrinfo('0.0.0.0', 80)[0][-1]
-    s = socket.socket()
-    s.bind(addr)
-    s.listen(1)
-    
-    print('Listening on', addr)
-    
-    # HTML with frontend image processing
-    html = """<!DOCTYPE html>
+# HTML with frontend image processing
+HTML = """<!DOCTYPE html>
     <html>
         <head>
             <title>E-Paper Display Control</title>
@@ -52,7 +26,6 @@ def start_webserver():
                 .preview-container { display: flex; gap: 20px; margin: 20px 0; }
                 .preview { flex: 1; }
                 canvas { border: 1px solid #ccc; }
-                .hidden { display: none; }
                 #status { margin-top: 10px; padding: 10px; }
                 .error { color: red; }
                 .success { color: green; }
@@ -63,6 +36,7 @@ def start_webserver():
                 <h1>E-Paper Display Control</h1>
                 <form id="uploadForm">
                     <input type="file" id="imageInput" accept="image/*" required>
+                    <label><input type="checkbox" id="crispScaling"> Crisp scaling (line art)</label>
                     <button type="submit">Upload and Display</button>
                 </form>
                 <div id="status"></div>
@@ -76,12 +50,14 @@ def start_webserver():
                         <canvas id="processedPreview" width="122" height="250"></canvas>
                     </div>
                 </div>
-                <canvas id="tempCanvas" class="hidden"></canvas>
             </div>
             <script>
                 const EPAPER_WIDTH = 122;
                 const EPAPER_HEIGHT = 250;
                 let processedImageData = null;
+                let sourceImage = null;
+                // Set to true by the server when it can inflate gzip uploads
+                const GZIP_UPLOAD = false;
                 
                 function showStatus(message, isError = false) {
                     const status = document.getElementById('status');
@@ -89,77 +65,200 @@ def start_webserver():
                     status.className = isError ? 'error' : 'success';
                 }
                 
-                function processImage(originalImage) {
-                    return new Promise((resolve) => {
-                        // Create a temporary canvas for initial scaling and grayscale conversion
-                        const tempCanvas = document.createElement('canvas');
-                        tempCanvas.width = originalImage.width;
-                        tempCanvas.height = originalImage.height;
-                        const tempCtx = tempCanvas.getContext('2d');
-
-                        // First draw original image and convert to grayscale
-                        tempCtx.drawImage(originalImage, 0, 0);
-                        const imageData = tempCtx.getImageData(0, 0, tempCanvas.width, tempCanvas.height);
-                        const data = imageData.data;
-
-                        // Convert to grayscale using simple averaging
-                        for (let i = 0; i < data.length; i += 4) {
-                            const avg = (data[i] + data[i + 1] + data[i + 2]) / 3;
-                            data[i] = data[i + 1] = data[i + 2] = avg;
+                // Threshold and bit-pack kernel assembled from image_pack.wat. It does
+                // the same work as packPixels() below; that JavaScript version is
+                // used if WebAssembly is unavailable.
+                const PACK_WASM = 'AGFzbQEAAAABBwFgA39/fwADAgEABQMBAAIHEQIGbWVtb3J5AgAEcGFjawAACr4BAbsBAQV/A0BBACEEQQAhBwNAIAMoAgAhBSAFQf8BcUHNAGwgBUEIdkH/AXFBlgFsaiAFQRB2Qf8BcUEdbGpBCHZBgAFLIQYgA0EAIAZrQYCAgHhyNgIAIAdBAXQgBnIhByADQQRqIQMgBEEBaiEEIARBB3FFBEAgAiAHOgAAIAJBAWohAkEAIQcLIAQgAEkNAAsgBEEHcQRAIAIgB0EIIARBB3FrdDoAACACQQFqIQILIAFBAWshASABDQALCw==';
+                let packWasm = null;
+                if (window.WebAssembly) {
+                    WebAssembly.instantiate(Uint8Array.from(atob(PACK_WASM), c => c.charCodeAt(0)))
+                        .then(result => { packWasm = result.instance.exports; })
+                        .catch(error => console.warn('WebAssembly unavailable, using JavaScript:', error));
+                }
+                
+                function packWithWasm(rgba, binaryData) {
+                    // RGBA pixels go at offset 0 of the module memory, packed bits after them
+                    const memory = new Uint8Array(packWasm.memory.buffer);
+                    memory.set(rgba);
+                    packWasm.pack(EPAPER_WIDTH, EPAPER_HEIGHT, rgba.length);
+                    rgba.set(memory.subarray(0, rgba.length));
+                    binaryData.set(memory.subarray(rgba.length, rgba.length + binaryData.length));
+                }
+                
+                function packPixels(pixels, binaryData) {
+                    // Threshold pixel i at 128 and paint it black or white in the
+                    // preview; returns 1 for white, which is a set bit on the e-paper
+                    const white = (i) => {
+                        const p = pixels[i];
+                        // Fixed-point ITU-R BT.601 luma (77/150/29 out of 256)
+                        const luma = ((p & 0xff) * 77 + ((p >> 8) & 0xff) * 150 + ((p >> 16) & 0xff) * 29) >> 8;
+                        // Branchless luma > 128: 128 - luma is negative exactly then
+                        const bit = ((128 - luma) >> 31) & 1;
+                        // -bit is all ones for white, giving 0xffffffff or 0xff000000
+                        pixels[i] = -bit | 0xff000000;
+                        return bit;
+                    };
+
+                    // Pack 8 pixels per output byte, MSB first; the last byte of
+                    // each row only holds the EPAPER_WIDTH % 8 leftover pixels.
+                    // Rows are contiguous in both arrays, so the pixel index i and
+                    // output index bi simply run forward with no per-row multiply
+                    const fullBytes = EPAPER_WIDTH >> 3;
+                    const tailPixels = EPAPER_WIDTH & 7;
+                    let i = 0;
+                    let bi = 0;
+                    for (let y = 0; y < EPAPER_HEIGHT; y++) {
+                        for (let xb = 0; xb < fullBytes; xb++, i += 8) {
+                            binaryData[bi++] =
+                                (white(i) << 7) | (white(i + 1) << 6) |
+                                (white(i + 2) << 5) | (white(i + 3) << 4) |
+                                (white(i + 4) << 3) | (white(i + 5) << 2) |
+                                (white(i + 6) << 1) | white(i + 7);
                         }
-                        tempCtx.putImageData(imageData, 0, 0);
-
-                        // Now scale the grayscale image to e-paper dimensions
-                        const processedCanvas = document.getElementById('processedPreview');
-                        const processedCtx = processedCanvas.getContext('2d');
-
-                        // Clear canvas with white background
-                        processedCtx.fillStyle = 'white';
-                        processedCtx.fillRect(0, 0, EPAPER_WIDTH, EPAPER_HEIGHT);
-
-                        // Calculate scaling to fit the image properly
-                        const scale = Math.min(
-                            EPAPER_WIDTH / originalImage.width,
-                            EPAPER_HEIGHT / originalImage.height
-                        );
-
-                        // Calculate dimensions and position to center the image
-                        const newWidth = originalImage.width * scale;
-                        const newHeight = originalImage.height * scale;
-                        const x = (EPAPER_WIDTH - newWidth) / 2;
-                        const y = (EPAPER_HEIGHT - newHeight) / 2;
-
-                        // Draw the scaled grayscale image
-                        processedCtx.drawImage(tempCanvas, x, y, newWidth, newHeight);
-
-                        // Convert to pure black and white
-                        const finalImageData = processedCtx.getImageData(0, 0, EPAPER_WIDTH, EPAPER_HEIGHT);
-                        const finalData = finalImageData.data;
-
-                        // Convert grayscale to binary format
-                        const linewidth = Math.ceil(EPAPER_WIDTH / 8);
-                        const binaryData = new Uint8Array(linewidth * EPAPER_HEIGHT);
-
-                        // Pack bits into bytes - convert grayscale to binary (inverted)
-                        for (let y = 0; y < EPAPER_HEIGHT; y++) {
-                            for (let x = 0; x < EPAPER_WIDTH; x++) {
-                                const i = (y * EPAPER_WIDTH + x) * 4;
-                                const byteIndex = y * linewidth + Math.floor(x / 8);
-                                const bitPosition = 7 - (x % 8);  // MSB first
-                                
-                                // Convert grayscale to binary (threshold at 128)
-                                // Note: isBlack condition is inverted (> instead of <)
-                                const isBlack = finalData[i] > 128;
-                                
-                                if (isBlack) {
-                                    binaryData[byteIndex] |= (1 << bitPosition);
-                                }
+                        if (tailPixels) {
+                            let byte = 0;
+                            for (let k = 0; k < tailPixels; k++) {
+                                byte |= white(i++) << (7 - k);
                             }
+                            binaryData[bi++] = byte;
                         }
+                    }
+                }
+                
+                // Scale the image to fit, centred on a white background, then
+                // threshold and bit-pack it. Runs in the worker below, or on the
+                // main thread when workers with OffscreenCanvas are unavailable.
+                function renderFrame(ctx, originalImage, crisp) {
+                    ctx.fillStyle = 'white';
+                    ctx.fillRect(0, 0, EPAPER_WIDTH, EPAPER_HEIGHT);
+
+                    // An <img> reports its layout size in width/height, so use its
+                    // intrinsic size; an ImageBitmap has no naturalWidth and its
+                    // width/height are already intrinsic
+                    const srcWidth = originalImage.naturalWidth ?? originalImage.width;
+                    const srcHeight = originalImage.naturalHeight ?? originalImage.height;
+
+                    // Calculate scaling to fit the image properly
+                    const scale = Math.min(
+                        EPAPER_WIDTH / srcWidth,
+                        EPAPER_HEIGHT / srcHeight
+                    );
+
+                    // Calculate dimensions and position to center the image
+                    const newWidth = srcWidth * scale;
+                    const newHeight = srcHeight * scale;
+                    const x = (EPAPER_WIDTH - newWidth) / 2;
+                    const y = (EPAPER_HEIGHT - newHeight) / 2;
+
+                    // Let the browser scale the original straight to e-paper size.
+                    // High-quality smoothing suits photos; nearest-neighbour keeps the
+                    // edges of line art sharp instead of blurring them into the threshold.
+                    ctx.imageSmoothingEnabled = !crisp;
+                    ctx.imageSmoothingQuality = 'high';
+                    ctx.drawImage(originalImage, x, y, newWidth, newHeight);
+
+                    // Grayscale, threshold and bit-pack in a single pass over the
+                    // scaled pixels, one 32-bit RGBA word per pixel.
+                    // Assumes a little-endian platform, i.e. R in the low byte.
+                    const finalImageData = ctx.getImageData(0, 0, EPAPER_WIDTH, EPAPER_HEIGHT);
+                    const linewidth = Math.ceil(EPAPER_WIDTH / 8);
+                    const binaryData = new Uint8Array(linewidth * EPAPER_HEIGHT);
 
-                        processedImageData = binaryData;
-                        resolve(binaryData);
-                    });
+                    if (packWasm) {
+                        packWithWasm(finalImageData.data, binaryData);
+                    } else {
+                        packPixels(new Uint32Array(finalImageData.data.buffer), binaryData);
+                    }
+                    return { pixels: finalImageData.data, binaryData };
+                }
+
+                // The worker is built from the functions above so the page stays a
+                // single response; it draws on an OffscreenCanvas and transfers the
+                // preview pixels and packed bits back without copying.
+                const WORKER_SOURCE = `
+                    const EPAPER_WIDTH = ${EPAPER_WIDTH};
+                    const EPAPER_HEIGHT = ${EPAPER_HEIGHT};
+                    let packWasm = null;
+                    const wasmReady = self.WebAssembly ?
+                        WebAssembly.instantiate(Uint8Array.from(atob('${PACK_WASM}'), c => c.charCodeAt(0)))
+                            .then(result => { packWasm = result.instance.exports; }, () => {}) :
+                        Promise.resolve();
+                    ${packWithWasm}
+                    ${packPixels}
+                    ${renderFrame}
+                    const ctx = new OffscreenCanvas(EPAPER_WIDTH, EPAPER_HEIGHT).getContext('2d');
+                    onmessage = async (e) => {
+                        await wasmReady;
+                        try {
+                            const result = renderFrame(ctx, e.data.bitmap, e.data.crisp);
+                            postMessage(result, [result.pixels.buffer, result.binaryData.buffer]);
+                        } catch (error) {
+                            postMessage({ error: String(error) });
+                        } finally {
+                            e.data.bitmap.close();
+                        }
+                    };`;
+
+                let worker = null;
+                const workerJobs = [];
+
+                function stopWorker(error) {
+                    console.warn('Image worker unavailable, processing on the main thread:', error);
+                    worker.terminate();
+                    worker = null;
+                    workerJobs.splice(0).forEach(job => job.reject(error));
+                }
+
+                if (window.Worker && window.OffscreenCanvas && window.createImageBitmap) {
+                    try {
+                        worker = new Worker(URL.createObjectURL(
+                            new Blob([WORKER_SOURCE], { type: 'text/javascript' })));
+                        // The worker handles messages in order, so replies match jobs FIFO
+                        worker.onmessage = (e) => {
+                            const job = workerJobs.shift();
+                            if (e.data.error) {
+                                job.reject(new Error(e.data.error));
+                            } else {
+                                job.resolve(e.data);
+                            }
+                        };
+                        worker.onerror = (e) => stopWorker(new Error(e.message));
+                    } catch (error) {
+                        console.warn('Image worker unavailable, processing on the main thread:', error);
+                        worker = null;
+                    }
+                }
+
+                async function processImage(originalImage) {
+                    const crisp = document.getElementById('crispScaling').checked;
+                    let result = null;
+
+                    if (worker) {
+                        try {
+                            const bitmap = await createImageBitmap(originalImage);
+                            result = await new Promise((resolve, reject) => {
+                                workerJobs.push({ resolve, reject });
+                                worker.postMessage({ bitmap, crisp }, [bitmap]);
+                            });
+                        } catch (error) {
+                            if (worker) {
+                                stopWorker(error);
+                            }
+                        }
+                    }
+
+                    const processedCanvas = document.getElementById('processedPreview');
+                    const processedCtx = processedCanvas.getContext('2d');
+                    if (!result) {
+                        result = renderFrame(processedCtx, originalImage, crisp);
+                    }
+
+                    // Show the black and white result in the preview
+                    processedCtx.putImageData(
+                        new ImageData(result.pixels, EPAPER_WIDTH, EPAPER_HEIGHT), 0, 0);
+
+                    processedImageData = result.binaryData;
+                    return result.binaryData;
                 }
                 
                 document.getElementById('imageInput').onchange = async function(e) {
@@ -169,18 +268,26 @@ def start_webserver():
                     if (file) {
                         const reader = new FileReader();
                         reader.onload = function(e) {
-                            preview.src = e.target.result;
-                            const img = new Image();
-                            img.onload = async function() {
-                                await processImage(img);
+                            // Process straight from the preview <img> so the file
+                            // is only decoded once
+                            preview.onload = async function() {
+                                sourceImage = preview;
+                                await processImage(preview);
                                 showStatus('Image processed and ready to upload');
                             };
-                            img.src = e.target.result;
+                            preview.src = e.target.result;
                         };
                         reader.readAsDataURL(file);
                     }
                 };
                 
+                document.getElementById('crispScaling').onchange = async function() {
+                    if (sourceImage) {
+                        await processImage(sourceImage);
+                        showStatus('Image processed and ready to upload');
+                    }
+                };
+                
                 document.getElementById('uploadForm').onsubmit = async function(e) {
                     e.preventDefault();
                     
@@ -194,12 +301,30 @@ def start_webserver():
                     showStatus('Uploading image to display...');
                     
                     try {
+                        // A packed frame is mostly long runs, so gzip usually shrinks
+                        // it several times over; send it raw if that is unavailable
+                        const headers = { 'Content-Type': 'application/octet-stream' };
+                        let body = processedImageData;
+                        if (GZIP_UPLOAD && window.CompressionStream) {
+                            try {
+                                const stream = new Blob([processedImageData]).stream()
+                                    .pipeThrough(new CompressionStream('gzip'));
+                                const compressed = new Uint8Array(await new Response(stream).arrayBuffer());
+                                // The server only accepts compressed frames smaller than raw ones
+                                if (compressed.length < processedImageData.length) {
+                                    body = compressed;
+                                    headers['Content-Encoding'] = 'gzip';
+                                }
+                            } catch (error) {
+                                console.warn('Compression failed, sending raw image:', error);
+                                body = processedImageData;
+                            }
+                        }
+                        
                         const response = await fetch('/display', {
                             method: 'POST',
-                            headers: {
-                                'Content-Type': 'application/octet-stream'
-                            },
-                            body: processedImageData
+                            headers,
+                            body
                         });
                         
                         let result;
@@ -225,6 +350,183 @@ def start_webserver():
         </body>
     </html>
     """
+
+# Let the page compress uploads when this firmware can decompress them
+if deflate is not None:
+    HTML = HTML.replace('const GZIP_UPLOAD = false;', 'const GZIP_UPLOAD = true;')
+
+def static_response(body, content_type, extra_headers=''):
+    # Complete 200 response for a body that never changes; extra_headers holds
+    # any further header lines, each ending in \r\n
+    head = ('HTTP/1.1 200 OK\r\n'
+            'Content-Type: %s\r\n'
+            '%s'
+            'Connection: close\r\n'
+            'Content-Length: %d\r\n\r\n') % (content_type, extra_headers, len(body))
+    return head.encode('utf-8') + body
+
+# Compression window for the page, 2**12 = 4 KiB. It is only allocated once at
+# startup and makes the page about 20% smaller than the minimum 512-byte window
+HTML_GZIP_WBITS = 12
+
+def gzip_bytes(data):
+    # Compress with the deflate module; returns None if the firmware was built
+    # without it or without compression support
+    if deflate is None:
+        return None
+    try:
+        buf = io.BytesIO()
+        stream = deflate.DeflateIO(buf, deflate.GZIP, HTML_GZIP_WBITS)
+        stream.write(data)
+        stream.close()
+        return buf.getvalue()
+    except (OSError, ValueError):
+        return None
+
+# The GET response never changes, so encode it and its headers once at startup
+HTML_BYTES = HTML.encode('utf-8')
+HTML_RESPONSE = static_response(HTML_BYTES, 'text/html; charset=utf-8')
+
+# Gzip'd copy of the page for browsers that accept it, also built once
+html_gzip = gzip_bytes(HTML_BYTES)
+HTML_GZIP_RESPONSE = None
+if html_gzip is not None:
+    HTML_GZIP_RESPONSE = static_response(html_gzip, 'text/html; charset=utf-8',
+                                         'Content-Encoding: gzip\r\nVary: Accept-Encoding\r\n')
+del html_gzip
+
+# Only the prebuilt responses are needed from here on; drop the str and bytes
+# copies of the page so they do not stay on the heap
+HTML_LEN = len(HTML_BYTES)
+del HTML, HTML_BYTES
+
+# A client that sends nothing for this long is dropped so that it cannot hang
+# the single-threaded server
+READ_TIMEOUT_MS = 2000
+
+# Request headers are read into this one buffer for every connection instead
+# of a new bytes object per recv()
+HDR_BUF = bytearray(1024)
+HDR_MV = memoryview(HDR_BUF)
+POST_DISPLAY = b'POST /display'
+
+@micropython.viper
+def find_bytes(buf, pattern, start: int, end: int) -> int:
+    # bytes.find() for a bytearray, which has no find() on MicroPython;
+    # returns the index of pattern within buf[start:end], or -1
+    b = ptr8(buf)
+    p = ptr8(pattern)
+    m = int(len(pattern))
+    i = start
+    while i <= end - m:
+        j = 0
+        while j < m and b[i + j] == p[j]:
+            j += 1
+        if j == m:
+            return i
+        i += 1
+    return -1
+
+def read_some(sock, poller, buf):
+    # Wait up to READ_TIMEOUT_MS for data, then read what has arrived into buf;
+    # returns 0 at end of stream. readinto() on a blocking MicroPython socket
+    # waits until buf is full, so the read itself is done non-blocking
+    while True:
+        if not poller.poll(READ_TIMEOUT_MS):
+            raise Exception('Client timeout')
+        sock.setblocking(False)
+        try:
+            n = sock.readinto(buf)
+        finally:
+            sock.setblocking(True)
+        if n is not None:
+            return n
+
+def parse_int(buf, start, end):
+    # Decimal value of the digits in buf[start:end], skipping spaces
+    value = 0
+    for i in range(start, end):
+        c = buf[i]
+        if 48 <= c <= 57:
+            value = value * 10 + c - 48
+        elif c != 32:
+            raise ValueError('invalid number')
+    return value
+
+def header_contains(buf, name, value, end):
+    # True if the header line starting with name (e.g. b'Accept-Encoding:')
+    # in buf[:end] contains value
+    start = find_bytes(buf, name, 0, end)
+    if start < 0:
+        return False
+    line_end = find_bytes(buf, b'\r\n', start, end)
+    return find_bytes(buf, value, start, line_end if line_end >= 0 else end) >= 0
+
+# Compressed uploads are inflated into this buffer, sized for one full frame
+FRAME_BYTES = ((DISPLAY_WIDTH + 7) // 8) * DISPLAY_HEIGHT
+FRAME_BUF = bytearray(FRAME_BYTES)
+# An upload inflates to exactly FRAME_BYTES (< 4096), so no back-reference can
+# reach further than a 4 KiB window; the default 32 KiB would be allocated on
+# every upload for nothing
+UPLOAD_WBITS = 12
+
+def connect_wifi(ssid, password):
+    # Create WLAN interface
+    wlan = network.WLAN(network.STA_IF)
+    wlan.active(True)
+    
+    # Connect to WiFi if not already connected
+    if not wlan.isconnected():
+        print(f'Connecting to WiFi network: {ssid}...')
+        wlan.connect(ssid, password)
+        
+        # Wait for connection with timeout
+        max_wait = 10
+        while max_wait > 0:
+            if wlan.isconnected():
+                break
+            max_wait -= 1
+            print('Waiting for connection...')
+            time.sleep(1)
+    
+    if wlan.isconnected():
+        print('WiFi connected successfully')
+        print('Network config:', wlan.ifconfig())
+        return True
+    else:
+        print('WiFi connection failed')
+        return False
+
+def send_all(sock, data):
+    # socket.write() may accept only part of the buffer; keep writing the
+    # remainder through a memoryview so no slices of data are copied
+    mv = memoryview(data)
+    sent = 0
+    while sent < len(mv):
+        sent += sock.write(mv[sent:])
+
+# The upload success response is fixed, so it is formatted once as well
+OK_BODY = b'{"success": true, "message": "Image successfully displayed on e-Paper"}'
+OK_RESPONSE = static_response(OK_BODY, 'application/json')
+
+# Error responses differ only in their message, so the headers are a fixed
+# template and json.dumps() is only used to escape the message string
+ERR_HEAD = (b'HTTP/1.1 500 Internal Server Error\r\n'
+            b'Content-Type: application/json\r\n'
+            b'Connection: close\r\n'
+            b'Content-Length: %d\r\n\r\n')
+
+def send_error(sock, message):
+    body = ('{"success": false, "message": %s}' % json.dumps(message)).encode('utf-8')
+    send_all(sock, ERR_HEAD % len(body) + body)
+
+def start_webserver(epd):
+    addr = socket.getaddrinfo('0.0.0.0', 80)[0][-1]
+    s = socket.socket()
+    s.bind(addr)
+    s.listen(1)
+    
+    print('Listening on', addr)
     
     while True:
         try:
@@ -232,130 +534,102 @@ def start_webserver():
             print('Client connected from', addr)
             
             try:
-                request = cl.recv(1024)
-                request_str = request.decode('utf-8')
+                poller = select.poll()
+                poller.register(cl, select.POLLIN)
+                # Read until the end of the headers, a full HDR_BUF or end of stream;
+                # any body bytes that arrive with the headers stay in HDR_BUF
+                request_len = 0
+                header_end = -1
+                while header_end < 0 and request_len < len(HDR_BUF):
+                    n = read_some(cl, poller, HDR_MV[request_len:])
+                    if not n:
+                        break
+                    # Only rescan from just before the new bytes
+                    header_end = find_bytes(HDR_BUF, b'\r\n\r\n', max(0, request_len - 3),
+                                            request_len + n)
+                    request_len += n
                 
                 # Handle POST request for display update
-                if 'POST /display' in request_str:
+                if find_bytes(HDR_BUF, POST_DISPLAY, 0, min(request_len, len(POST_DISPLAY))) == 0:
                     print('Receiving display update request...')
                     
                     try:
-                        # Find the content length
-                        headers = request_str.split('\r\n\r\n')[0]
-                        content_length = int([line for line in headers.split('\r\n') if 'Content-Length:' in line][0].split(': ')[1])
+                        # Find the content length, parsing the raw bytes in HDR_BUF
+                        # so no decoded copy of the request is made
+                        if header_end < 0:
+                            raise Exception('Incomplete request headers')
+                        length_start = find_bytes(HDR_BUF, b'Content-Length:', 0, header_end)
+                        if length_start < 0:
+                            raise Exception('Missing Content-Length header')
+                        length_end = find_bytes(HDR_BUF, b'\r\n', length_start, request_len)
+                        content_length = parse_int(HDR_BUF, length_start + 15, length_end)
                         
-                        # Read the binary data
-                        body_start = request_str.find('\r\n\r\n') + 4
-                        binary_data = bytearray(request[body_start:])
-                        remaining = content_length - len(binary_data)
+                        # Content-Length is untrusted, so check it before allocating: a
+                        # raw upload is exactly one frame and a compressed one is smaller
+                        gzip_body = header_contains(HDR_BUF, b'Content-Encoding:', b'gzip', header_end)
+                        if gzip_body and deflate is None:
+                            raise Exception('Compressed uploads not supported')
+                        if content_length > FRAME_BYTES or (not gzip_body and content_length != FRAME_BYTES):
+                            raise Exception(f'Image data must be {FRAME_BYTES} bytes, or fewer gzip-compressed')
                         
-                        while remaining > 0:
-                            chunk = cl.recv(min(remaining, 1024))
-                            if not chunk:
+                        # Read the binary data straight into a buffer of its final size;
+                        # readinto() fills it in place without a bytes object per chunk
+                        binary_data = bytearray(content_length)
+                        mv = memoryview(binary_data)
+                        body = HDR_MV[header_end + 4:request_len]
+                        received = min(len(body), content_length)
+                        mv[:received] = body[:received]
+                        
+                        # Each read returns what has arrived, so a client that stalls
+                        # part-way through the body times out in read_some()
+                        while received < content_length:
+                            n = read_some(cl, poller, mv[received:])
+                            if not n:
                                 break
-                            binary_data.extend(chunk)
-                            remaining -= len(chunk)
+                            received += n
                         
-                        print(f'Received {len(binary_data)} bytes of image data')
+                        print(f'Received {received} bytes of image data')
                         
-                        if len(binary_data) == content_length:
-                            # Initialize and update e-paper display
-                            epd = EPaperDisplay()
-                            epd.init()
-                            epd.display(binary_data)
+                        if received == content_length:
+                            if gzip_body:
+                                # Inflate straight into the preallocated frame buffer
+                                stream = deflate.DeflateIO(io.BytesIO(binary_data), deflate.GZIP, UPLOAD_WBITS)
+                                if stream.readinto(FRAME_BUF) != FRAME_BYTES or stream.read(1):
+                                    raise Exception('Invalid compressed image size')
+                                binary_data = FRAME_BUF
                             
-                            response = json.dumps({
-                                'success': True,
-                                'message': 'Image successfully displayed on e-Paper'
-                            })
-                            
-                            response_headers = [
-                                'HTTP/1.1 200 OK',
-                                'Content-Type: application/json',
-                                'Connection: keep-alive',
-                                f'Content-Length: {len(response)}',
-                                '',
-                                ''
-                            ]
-                            cl.send('\r\n'.join(response_headers).encode())
-                            cl.send(response.encode())
+                            # Update the e-paper display initialized once in main()
+                            epd.display(binary_data)
+                            send_all(cl, OK_RESPONSE)
                             print('Display update successful')
                         else:
                             raise Exception('Incomplete data received')
                             
                     except Exception as e:
                         print('Error processing display update:', str(e))
-                        response = json.dumps({
-                            'success': False,
-                            'message': f'Error updating display: {str(e)}'
-                        })
-                        response_headers = [
-                            'HTTP/1.1 500 Internal Server Error',
-                            'Content-Type: application/json',
-                            'Connection: keep-alive',
-                            f'Content-Length: {len(response)}',
-                            '',
-                            ''
-                        ]
-                        cl.send('\r\n'.join(response_headers).encode())
-                        cl.send(response.encode())
+                        send_error(cl, f'Error updating display: {str(e)}')
                 
                 # Handle GET request for main page
                 else:
-                    # Encode the HTML content first
-                    html_encoded = html.encode('utf-8')
-                    
-                    # Send response headers first
-                    response_headers = [
-                        'HTTP/1.1 200 OK',
-                        'Content-Type: text/html; charset=utf-8',
-                        'Connection: close',  # Changed to close
-                        f'Content-Length: {len(html_encoded)}',
-                        '',
-                        ''
-                    ]
-                    
                     try:
-                        # Send headers
-                        cl.send('\r\n'.join(response_headers).encode('utf-8'))
-                        
-                        # Send content in chunks
-                        chunk_size = 1024
-                        for i in range(0, len(html_encoded), chunk_size):
-                            chunk = html_encoded[i:i + chunk_size]
-                            cl.send(chunk)
-                            time.sleep(0.01)  # Small delay between chunks
-                        
-                        print(f'Sent {len(html_encoded)} bytes of HTML content')
+                        if HTML_GZIP_RESPONSE is not None and header_contains(HDR_BUF, b'Accept-Encoding:', b'gzip', request_len):
+                            send_all(cl, HTML_GZIP_RESPONSE)
+                            print(f'Sent {len(HTML_GZIP_RESPONSE)} bytes of gzip HTML response')
+                        else:
+                            send_all(cl, HTML_RESPONSE)
+                            print(f'Sent {HTML_LEN} bytes of HTML content')
                     except Exception as e:
                         print(f'Error sending response: {e}')
                 
             except Exception as e:
                 print('Error handling request:', str(e))
-                error_response = json.dumps({
-                    'success': False,
-                    'message': f'Server error: {str(e)}'
-                }).encode('utf-8')
-                
-                response_headers = [
-                    'HTTP/1.1 500 Internal Server Error',
-                    'Content-Type: application/json; charset=utf-8',
-                    'Connection: close',
-                    f'Content-Length: {len(error_response)}',
-                    '',
-                    ''
-                ]
-                
                 try:
-                    # Send error response in chunks too
-                    cl.send('\r\n'.join(response_headers).encode('utf-8'))
-                    cl.send(error_response)
+                    send_error(cl, f'Server error: {str(e)}')
                 except:
                     pass
             
             finally:
                 try:
-                    time.sleep(0.1)  # Give time for data to be sent
                     cl.close()
                 except:
                     pass
@@ -373,7 +647,10 @@ def main():
     PASSWORD = "NoCompartir123!"
     
     if connect_wifi(SSID, PASSWORD):
-        start_webserver()
+        # Initialize the display once; each upload then only sends a new frame
+        epd = EPaperDisplay()
+        epd.init()
+        start_webserver(epd)
 
 if __name__ == "__main__":
     main()